@@ -1,301 +1,393 @@
-"""
-Algoritmo para encontrar oportunidades de compra de "pontas".
-Identifica sequências onde o MEIO está ocupado (contempladas ou não-disponíveis)
-e as PONTAS estão disponíveis para compra.
-
-Estratégia: Se o meio já está bloqueado, comprar só as pontas é suficiente
-para capturar qualquer sorteio que caia naquela região!
-"""
-
-import sys
-import json
-from pathlib import Path
-import pandas as pd
-
-
-def load_group_data(grupo_path: str):
-    """Carrega dados do grupo."""
-    grupo_dir = Path(grupo_path)
-    
-    # Carregar total de cotas
-    config_file = grupo_dir / "configuracao.json"
-    total_file = grupo_dir / "total_cotas.txt"
-    
-    if config_file.exists():
-        with open(config_file, 'r') as f:
-            config = json.load(f)
-        total_quotas = config['total_cotas']
-    elif total_file.exists():
-        with open(total_file, 'r') as f:
-            total_quotas = int(f.read().strip())
-    else:
-        raise FileNotFoundError("Arquivo de configuração não encontrado")
-    
-    # Carregar contempladas
-    contemplated = set()
-    contemplated_csv = grupo_dir / "cotas_contempladas.csv"
-    contemplated_txt = grupo_dir / "cotas_contempladas.txt"
-    
-    if contemplated_csv.exists():
-        df = pd.read_csv(contemplated_csv)
-        for cotas_str in df['cotas']:
-            if pd.notna(cotas_str):
-                for cota in str(cotas_str).split('-'):
-                    contemplated.add(int(cota.strip()))
-    elif contemplated_txt.exists():
-        with open(contemplated_txt, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    contemplated.add(int(line))
-    
-    # Carregar disponíveis
-    available = set()
-    available_file = grupo_dir / "cotas_disponiveis.txt"
-    if available_file.exists():
-        with open(available_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    available.add(int(line))
-    
-    # Calcular ativas e ocupadas (contempladas + não disponíveis)
-    all_quotas = set(range(1, total_quotas + 1))
-    active = all_quotas - contemplated
-    occupied = contemplated | (active - available)  # contempladas + ativas não-disponíveis
-    
-    return {
-        'total_quotas': total_quotas,
-        'contemplated': contemplated,
-        'active': active,
-        'available': available,
-        'occupied': occupied  # cotas que não podem ser compradas
-    }
-
-
-def find_edge_opportunities(data: dict, min_length: int = 5, min_occupied_pct: float = 0.5):
-    """
-    Encontra oportunidades de compra de pontas.
-    
-    Args:
-        data: Dados do grupo
-        min_length: Tamanho mínimo da sequência para considerar
-        min_occupied_pct: Percentual mínimo do meio que deve estar ocupado
-    
-    Returns:
-        Lista de oportunidades ordenadas por score
-    """
-    opportunities = []
-    
-    # Para cada sequência possível de tamanho min_length ou maior
-    for start in range(1, data['total_quotas'] - min_length + 2):
-        for length in range(min_length, min(51, data['total_quotas'] - start + 2)):
-            end = start + length - 1
-            
-            # Definir pontas (primeira e última) e meio
-            left_edge = start
-            right_edge = end
-            middle = set(range(start + 1, end))
-            
-            if not middle:  # sequência muito pequena
-                continue
-            
-            # Verificar se ambas as pontas estão disponíveis
-            if left_edge not in data['available'] or right_edge not in data['available']:
-                continue
-            
-            # Contar quantas do meio estão ocupadas (contempladas ou não-disponíveis)
-            middle_occupied = middle & data['occupied']
-            middle_available = middle & data['available']
-            
-            occupied_pct = len(middle_occupied) / len(middle)
-            
-            # Filtrar: pelo menos min_occupied_pct do meio deve estar ocupado
-            if occupied_pct < min_occupied_pct:
-                continue
-            
-            # Calcular score (quanto mais ocupado o meio, melhor)
-            # Score = tamanho * percentual_ocupado * 100
-            score = length * occupied_pct * 100
-            
-            opportunities.append({
-                'start': left_edge,
-                'end': right_edge,
-                'length': length,
-                'middle_occupied': len(middle_occupied),
-                'middle_available': len(middle_available),
-                'middle_total': len(middle),
-                'occupied_pct': occupied_pct,
-                'score': score,
-                'middle_occupied_list': sorted(middle_occupied),
-                'middle_available_list': sorted(middle_available)
-            })
-    
-    # Ordenar por score (maior primeiro)
-    opportunities.sort(key=lambda x: x['score'], reverse=True)
-    
-    return opportunities
-
-
-def analyze_edge_opportunities(grupo_path: str, top_n: int = 10, min_length: int = 5, min_occupied_pct: float = 0.5):
-    """
-    Analisa oportunidades de compra de pontas.
-    
-    Args:
-        grupo_path: Caminho para pasta do grupo
-        top_n: Número de oportunidades para mostrar
-        min_length: Tamanho mínimo da sequência
-        min_occupied_pct: Percentual mínimo ocupado no meio (0.0 a 1.0)
-    """
-    grupo_dir = Path(grupo_path)
-    if not grupo_dir.exists():
-        print(f"❌ Grupo não encontrado: {grupo_path}")
-        return
-    
-    print("=" * 80)
-    print(f"ANÁLISE DE OPORTUNIDADES DE COMPRA DE PONTAS - Grupo: {grupo_dir.name}")
-    print("=" * 80)
-    print()
-    
-    # Carregar dados
-    try:
-        data = load_group_data(str(grupo_dir))
-    except Exception as e:
-        print(f"Erro ao carregar grupo: {e}")
-        return
-    
-    # Resumo
-    available_active = data['active'] & data['available']
-    print(f"📊 Resumo:")
-    print(f"   Total de cotas: {data['total_quotas']}")
-    print(f"   Contempladas: {len(data['contemplated'])}")
-    print(f"   Disponíveis para compra: {len(available_active)}")
-    print(f"   Ocupadas (não compráveis): {len(data['occupied'])}")
-    print()
-    
-    print(f"🔍 Critérios de busca:")
-    print(f"   Tamanho mínimo: {min_length} cotas")
-    print(f"   Ocupação mínima do meio: {min_occupied_pct*100:.0f}%")
-    print()
-    
-    # Encontrar oportunidades
-    opportunities = find_edge_opportunities(data, min_length, min_occupied_pct)
-    
-    if not opportunities:
-        print("⚠️  Nenhuma oportunidade de ponta encontrada com esses critérios.")
-        return
-    
-    print("=" * 80)
-    print(f"🎯 TOP {min(top_n, len(opportunities))} OPORTUNIDADES DE COMPRA DE PONTAS")
-    print("=" * 80)
-    print()
-    print("💡 ESTRATÉGIA: Comprar apenas as PONTAS de sequências onde o MEIO")
-    print("   já está ocupado (contempladas ou não-disponíveis).")
-    print()
-    print("✅ VANTAGEM: Investimento mínimo (2 cotas) para cobrir região inteira!")
-    print()
-    
-    # Mostrar top oportunidades
-    for i, opp in enumerate(opportunities[:top_n], 1):
-        print(f"#{i} Oportunidade: Cotas {opp['start']} e {opp['end']}")
-        print(f"   📏 Sequência: {opp['length']} cotas ({opp['start']}-{opp['end']})")
-        print(f"   💰 Investimento: 2 cotas (pontas)")
-        print(f"   🔒 Meio ocupado: {opp['middle_occupied']}/{opp['middle_total']} ({opp['occupied_pct']*100:.0f}%)")
-        print(f"   ⚠️  Meio disponível: {opp['middle_available']} cotas")
-        print(f"   ⭐ Score: {opp['score']:.1f}")
-        
-        # Mostrar detalhes do meio se for pequeno
-        if opp['middle_total'] <= 20:
-            occupied_str = ', '.join(map(str, opp['middle_occupied_list'][:10]))
-            if len(opp['middle_occupied_list']) > 10:
-                occupied_str += f", ... (+{len(opp['middle_occupied_list'])-10})"
-            print(f"   🔒 Meio ocupado: {occupied_str}")
-            
-            if opp['middle_available']:
-                available_str = ', '.join(map(str, opp['middle_available_list']))
-                print(f"   ⚠️  Meio disponível: {available_str}")
-                print(f"      (Risco: outra pessoa pode comprar essas)")
-        
-        print()
-    
-    # Estatísticas gerais
-    print("=" * 80)
-    print("📈 ESTATÍSTICAS")
-    print("=" * 80)
-    print()
-    
-    print(f"Total de oportunidades encontradas: {len(opportunities)}")
-    
-    if opportunities:
-        avg_length = sum(o['length'] for o in opportunities) / len(opportunities)
-        avg_occupied = sum(o['occupied_pct'] for o in opportunities) / len(opportunities)
-        best = opportunities[0]
-        
-        print(f"Tamanho médio das sequências: {avg_length:.1f} cotas")
-        print(f"Ocupação média do meio: {avg_occupied*100:.0f}%")
-        print(f"Melhor oportunidade: Cotas {best['start']} e {best['end']} (score: {best['score']:.1f})")
-    
-    print()
-    print("=" * 80)
-    print("⚠️  ATENÇÃO - RISCO")
-    print("=" * 80)
-    print()
-    print("🚨 Se houver cotas DISPONÍVEIS no meio, outra pessoa pode comprá-las")
-    print("   e ganhar antes de você!")
-    print()
-    print("✅ IDEAL: Escolher sequências onde o meio está 100% ocupado")
-    print("   (contempladas ou não-disponíveis)")
-    print()
-    print("💡 DICA: Use --min-occupied 1.0 para ver apenas oportunidades perfeitas")
-    print()
-
-
-def main():
-    if len(sys.argv) < 2:
-        print("Uso: python analisar_pontas.py grupos/nome_do_grupo [top_n] [--min-length N] [--min-occupied X.X]")
-        print()
-        print("Parâmetros:")
-        print("  top_n            Número de oportunidades para mostrar (default: 10)")
-        print("  --min-length N   Tamanho mínimo da sequência (default: 5)")
-        print("  --min-occupied X Percentual mínimo ocupado 0.0-1.0 (default: 0.5 = 50%)")
-        print()
-        print("Exemplos:")
-        print("  python analisar_pontas.py grupos/6032")
-        print("  python analisar_pontas.py grupos/6032 20")
-        print("  python analisar_pontas.py grupos/6032 10 --min-length 10 --min-occupied 0.8")
-        print("  python analisar_pontas.py grupos/6032 5 --min-occupied 1.0  # apenas 100% ocupado")
-        print()
-        print("Estratégia:")
-        print("  Se uma sequência tem o MEIO ocupado (contempladas ou não-disponíveis),")
-        print("  basta comprar as PONTAS (2 cotas) para cobrir toda a região!")
-        print()
-        print("  Exemplo: Sequência 100-110")
-        print("    Meio (101-109): 8 contempladas + 1 não-disponível = 100% ocupado")
-        print("    Pontas: 100 e 110 disponíveis")
-        print("    Investimento: 2 cotas cobrindo 11 posições!")
-        return
-    
-    grupo_path = sys.argv[1]
-    top_n = 10
-    min_length = 5
-    min_occupied_pct = 0.5
-    
-    # Parse argumentos
-    i = 2
-    while i < len(sys.argv):
-        if sys.argv[i] == '--min-length' and i + 1 < len(sys.argv):
-            min_length = int(sys.argv[i + 1])
-            i += 2
-        elif sys.argv[i] == '--min-occupied' and i + 1 < len(sys.argv):
-            min_occupied_pct = float(sys.argv[i + 1])
-            i += 2
-        else:
-            top_n = int(sys.argv[i])
-            i += 1
-    
-    analyze_edge_opportunities(grupo_path, top_n=top_n, min_length=min_length, 
-                              min_occupied_pct=min_occupied_pct)
-
-
-if __name__ == "__main__":
-    main()
+"""
+Algoritmo para encontrar oportunidades de compra de "pontas".
+Identifica sequências onde o MEIO está ocupado (contempladas ou não-disponíveis)
+e as PONTAS estão disponíveis para compra.
+
+Estratégia: Se o meio já está bloqueado, comprar só as pontas é suficiente
+para capturar qualquer sorteio que caia naquela região!
+"""
+
+import sys
+from pathlib import Path
+import numpy as np
+
+from consorcio.data_loader import load_group_data
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba é opcional; sem ele usamos a varredura NumPy
+    njit = None
+    prange = range
+
+
+def _sweep_numpy(occ_cum, avail_cum, available_arr, total, min_length, min_occupied_pct):
+    """
+    Varredura vetorizada: para cada tamanho, todos os starts candidatos são
+    avaliados de uma vez via máscaras booleanas, sem loop Python por start.
+
+    Returns:
+        Tupla de arrays paralelos (starts, lengths, middle_occupied, middle_available)
+    """
+    surv_starts = []
+    surv_lengths = []
+    surv_occupied = []
+    surv_available = []
+
+    for length in range(min_length, min(50, total) + 1):
+        middle_total = length - 2
+        if middle_total <= 0:  # sequência muito pequena
+            continue
+
+        starts = np.arange(1, total - length + 2, dtype=np.int32)
+        if starts.size == 0:
+            continue
+
+        # Ponta esquerda primeiro: starts sem ela disponível saem antes de
+        # qualquer cálculo de meio/ponta direita
+        starts = starts[available_arr[starts]]
+        if starts.size == 0:
+            continue
+        ends = starts + (length - 1)
+
+        # Contar quantas do meio estão ocupadas (contempladas ou não-disponíveis)
+        mid_occ = occ_cum[ends - 1] - occ_cum[starts]
+        occupied_pct = mid_occ / middle_total
+
+        # Ponta direita disponível + pelo menos min_occupied_pct do meio ocupado
+        mask = available_arr[ends] & (occupied_pct >= min_occupied_pct)
+        if not mask.any():
+            continue
+
+        surv_starts.append(starts[mask])
+        surv_lengths.append(np.full(int(mask.sum()), length, dtype=np.int32))
+        surv_occupied.append(mid_occ[mask])
+        surv_available.append(avail_cum[ends[mask] - 1] - avail_cum[starts[mask]])
+
+    if not surv_starts:
+        empty = np.empty(0, dtype=np.int32)
+        return empty, empty.copy(), empty.copy(), empty.copy()
+
+    return (np.concatenate(surv_starts), np.concatenate(surv_lengths),
+            np.concatenate(surv_occupied), np.concatenate(surv_available))
+
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def _sweep_numba(occ_cum, avail_cum, available_arr, total, min_length, min_occupied_pct):
+        """
+        Mesma varredura de _sweep_numpy, compilada pelo numba. Cada start é
+        independente, então o loop externo roda em prange com cada thread
+        escrevendo na sua própria fatia de 50 posições; a compactação final
+        é serial. A ordem de saída não importa (o chamador reordena).
+        """
+        n_starts = max(total - min_length + 1, 0)
+        starts_out = np.empty(n_starts * 50, dtype=np.int32)
+        lens_out = np.empty(n_starts * 50, dtype=np.int32)
+        occ_out = np.empty(n_starts * 50, dtype=np.int32)
+        avail_out = np.empty(n_starts * 50, dtype=np.int32)
+        counts = np.zeros(n_starts, dtype=np.int32)
+
+        for si in prange(n_starts):
+            start = si + 1
+            # Ponta esquerda indisponível descarta todos os tamanhos deste start
+            if not available_arr[start]:
+                continue
+            base = si * 50
+            k = 0
+            max_length = min(50, total - start + 1)
+            for length in range(min_length, max_length + 1):
+                middle_total = length - 2
+                if middle_total <= 0:
+                    continue
+                end = start + length - 1
+                if not available_arr[end]:
+                    continue
+                mid_occ = occ_cum[end - 1] - occ_cum[start]
+                if mid_occ / middle_total < min_occupied_pct:
+                    continue
+                starts_out[base + k] = start
+                lens_out[base + k] = length
+                occ_out[base + k] = mid_occ
+                avail_out[base + k] = avail_cum[end - 1] - avail_cum[start]
+                k += 1
+            counts[si] = k
+
+        total_k = int(counts.sum())
+        starts_res = np.empty(total_k, dtype=np.int32)
+        lens_res = np.empty(total_k, dtype=np.int32)
+        occ_res = np.empty(total_k, dtype=np.int32)
+        avail_res = np.empty(total_k, dtype=np.int32)
+        pos = 0
+        for si in range(n_starts):
+            base = si * 50
+            for j in range(counts[si]):
+                starts_res[pos] = starts_out[base + j]
+                lens_res[pos] = lens_out[base + j]
+                occ_res[pos] = occ_out[base + j]
+                avail_res[pos] = avail_out[base + j]
+                pos += 1
+
+        return starts_res, lens_res, occ_res, avail_res
+else:
+    _sweep_numba = None
+
+
+def find_edge_opportunities(data: dict, min_length: int = 5, min_occupied_pct: float = 0.5,
+                            top_n: int = None):
+    """
+    Encontra oportunidades de compra de pontas.
+
+    Args:
+        data: Dados do grupo
+        min_length: Tamanho mínimo da sequência para considerar
+        min_occupied_pct: Percentual mínimo do meio que deve estar ocupado
+        top_n: Se informado, materializa apenas as top_n oportunidades
+               (as estatísticas continuam cobrindo todas as encontradas)
+
+    Returns:
+        Tupla (oportunidades ordenadas por score, estatísticas do total):
+        stats = {'count', 'avg_length', 'avg_occupied_pct'}
+    """
+    # Invariantes do grupo hoisted para locais: nada de lookup de dict nem
+    # reconstrução de somas prefixadas dentro da varredura
+    occ_cum = data['occ_cum']
+    avail_cum = data['avail_cum']
+    available_arr = data['available_arr']
+    total = data['total_quotas']
+
+    sweep = _sweep_numba if _sweep_numba is not None else _sweep_numpy
+    all_starts, all_lengths, all_occupied, all_available = sweep(
+        occ_cum, avail_cum, available_arr, total, min_length, float(min_occupied_pct))
+
+    opportunities = []
+    stats = {'count': 0, 'avg_length': 0.0, 'avg_occupied_pct': 0.0}
+
+    if all_starts.size:
+        # Reordenar por (start, length) para manter a ordem de inserção do
+        # algoritmo original (desempates do sort estável ficam idênticos)
+        order = np.lexsort((all_lengths, all_starts))
+        all_starts = all_starts[order]
+        all_lengths = all_lengths[order]
+        all_occupied = all_occupied[order]
+        all_available = all_available[order]
+
+        # Score = tamanho * percentual_ocupado * 100, vetorizado
+        occupied_pcts = all_occupied / (all_lengths - 2)
+        scores = all_lengths * occupied_pcts * 100
+
+        # Estatísticas sobre TODAS as oportunidades, direto dos arrays
+        stats = {
+            'count': int(scores.size),
+            'avg_length': float(all_lengths.mean()),
+            'avg_occupied_pct': float(occupied_pcts.mean()),
+        }
+
+        # Ordenar por score desc com desempate pelo índice de inserção
+        # (equivale ao sort estável anterior); com top_n, só os top_n
+        # viram dicts — os demais nunca são materializados
+        ranked = np.lexsort((np.arange(scores.size, dtype=np.int32), -scores))
+
+        # Guardar a melhor oportunidade nas estatísticas antes do corte,
+        # para que ela exista mesmo com top_n menor que 1
+        best = int(ranked[0])
+        stats['best_start'] = int(all_starts[best])
+        stats['best_end'] = int(all_starts[best]) + int(all_lengths[best]) - 1
+        stats['best_score'] = float(scores[best])
+
+        if top_n is not None:
+            ranked = ranked[:top_n]
+
+        # Pico de memória fica em O(top_n) dicts: os candidatos vivem apenas
+        # como colunas NumPy compactas até este ponto
+        opportunities = [{
+            'start': int(all_starts[i]),
+            'end': int(all_starts[i]) + int(all_lengths[i]) - 1,
+            'length': int(all_lengths[i]),
+            'middle_occupied': int(all_occupied[i]),
+            'middle_available': int(all_available[i]),
+            'middle_total': int(all_lengths[i]) - 2,
+            'occupied_pct': float(occupied_pcts[i]),
+            'score': float(scores[i])
+        } for i in ranked]
+
+    # Materializar as listas do meio só para as oportunidades retornadas e
+    # apenas quando o meio é pequeno o bastante para ser exibido (<= 20);
+    # flatnonzero na fatia booleana já devolve as cotas em ordem
+    # Tuplas em vez de listas: menos overhead por objeto e imutáveis
+    occupied_arr = data['occupied_arr']
+    for opp in opportunities:
+        if opp['middle_total'] > 20:
+            opp['middle_occupied_list'] = ()
+            opp['middle_available_list'] = ()
+            continue
+        lo, hi = opp['start'] + 1, opp['end']
+        opp['middle_occupied_list'] = tuple((np.flatnonzero(occupied_arr[lo:hi]) + lo).tolist())
+        opp['middle_available_list'] = tuple((np.flatnonzero(available_arr[lo:hi]) + lo).tolist())
+
+    return opportunities, stats
+
+
+def analyze_edge_opportunities(grupo_path: str, top_n: int = 10, min_length: int = 5, min_occupied_pct: float = 0.5):
+    """
+    Analisa oportunidades de compra de pontas.
+    
+    Args:
+        grupo_path: Caminho para pasta do grupo
+        top_n: Número de oportunidades para mostrar
+        min_length: Tamanho mínimo da sequência
+        min_occupied_pct: Percentual mínimo ocupado no meio (0.0 a 1.0)
+    """
+    grupo_dir = Path(grupo_path)
+    if not grupo_dir.exists():
+        print(f"❌ Grupo não encontrado: {grupo_path}")
+        return
+    
+    print("=" * 80)
+    print(f"ANÁLISE DE OPORTUNIDADES DE COMPRA DE PONTAS - Grupo: {grupo_dir.name}")
+    print("=" * 80)
+    print()
+    
+    # Carregar dados
+    try:
+        data = load_group_data(str(grupo_dir))
+    except Exception as e:
+        print(f"Erro ao carregar grupo: {e}")
+        return
+    
+    # Resumo (contagens direto nos bitmaps, sem interseção de sets)
+    num_available_active = int(np.count_nonzero(data['active_arr'] & data['available_arr']))
+    print(f"📊 Resumo:")
+    print(f"   Total de cotas: {data['total_quotas']}")
+    print(f"   Contempladas: {len(data['contemplated'])}")
+    print(f"   Disponíveis para compra: {num_available_active}")
+    print(f"   Ocupadas (não compráveis): {int(np.count_nonzero(data['occupied_arr']))}")
+    print()
+    
+    print(f"🔍 Critérios de busca:")
+    print(f"   Tamanho mínimo: {min_length} cotas")
+    print(f"   Ocupação mínima do meio: {min_occupied_pct*100:.0f}%")
+    print()
+    
+    # Encontrar oportunidades (só as top_n são materializadas como dicts)
+    opportunities, stats = find_edge_opportunities(data, min_length, min_occupied_pct,
+                                                   top_n=top_n)
+
+    # Checar o total de candidatos, não a lista truncada: com top_n=0 a lista
+    # sai vazia mesmo havendo oportunidades, e as estatísticas ainda valem
+    if stats['count'] == 0:
+        print("⚠️  Nenhuma oportunidade de ponta encontrada com esses critérios.")
+        return
+    
+    print("=" * 80)
+    print(f"🎯 TOP {min(top_n, len(opportunities))} OPORTUNIDADES DE COMPRA DE PONTAS")
+    print("=" * 80)
+    print()
+    print("💡 ESTRATÉGIA: Comprar apenas as PONTAS de sequências onde o MEIO")
+    print("   já está ocupado (contempladas ou não-disponíveis).")
+    print()
+    print("✅ VANTAGEM: Investimento mínimo (2 cotas) para cobrir região inteira!")
+    print()
+    
+    # Mostrar top oportunidades
+    for i, opp in enumerate(opportunities[:top_n], 1):
+        print(f"#{i} Oportunidade: Cotas {opp['start']} e {opp['end']}")
+        print(f"   📏 Sequência: {opp['length']} cotas ({opp['start']}-{opp['end']})")
+        print(f"   💰 Investimento: 2 cotas (pontas)")
+        print(f"   🔒 Meio ocupado: {opp['middle_occupied']}/{opp['middle_total']} ({opp['occupied_pct']*100:.0f}%)")
+        print(f"   ⚠️  Meio disponível: {opp['middle_available']} cotas")
+        print(f"   ⭐ Score: {opp['score']:.1f}")
+        
+        # Mostrar detalhes do meio se for pequeno
+        if opp['middle_total'] <= 20:
+            occupied_str = ', '.join(map(str, opp['middle_occupied_list'][:10]))
+            if len(opp['middle_occupied_list']) > 10:
+                occupied_str += f", ... (+{len(opp['middle_occupied_list'])-10})"
+            print(f"   🔒 Meio ocupado: {occupied_str}")
+            
+            if opp['middle_available']:
+                available_str = ', '.join(map(str, opp['middle_available_list']))
+                print(f"   ⚠️  Meio disponível: {available_str}")
+                print(f"      (Risco: outra pessoa pode comprar essas)")
+        
+        print()
+    
+    # Estatísticas gerais
+    print("=" * 80)
+    print("📈 ESTATÍSTICAS")
+    print("=" * 80)
+    print()
+    
+    print(f"Total de oportunidades encontradas: {stats['count']}")
+
+    if stats['count']:
+        avg_length = stats['avg_length']
+        avg_occupied = stats['avg_occupied_pct']
+
+        print(f"Tamanho médio das sequências: {avg_length:.1f} cotas")
+        print(f"Ocupação média do meio: {avg_occupied*100:.0f}%")
+        print(f"Melhor oportunidade: Cotas {stats['best_start']} e {stats['best_end']} (score: {stats['best_score']:.1f})")
+    
+    print()
+    print("=" * 80)
+    print("⚠️  ATENÇÃO - RISCO")
+    print("=" * 80)
+    print()
+    print("🚨 Se houver cotas DISPONÍVEIS no meio, outra pessoa pode comprá-las")
+    print("   e ganhar antes de você!")
+    print()
+    print("✅ IDEAL: Escolher sequências onde o meio está 100% ocupado")
+    print("   (contempladas ou não-disponíveis)")
+    print()
+    print("💡 DICA: Use --min-occupied 1.0 para ver apenas oportunidades perfeitas")
+    print()
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Uso: python analisar_pontas.py grupos/nome_do_grupo [top_n] [--min-length N] [--min-occupied X.X]")
+        print()
+        print("Parâmetros:")
+        print("  top_n            Número de oportunidades para mostrar (default: 10)")
+        print("  --min-length N   Tamanho mínimo da sequência (default: 5)")
+        print("  --min-occupied X Percentual mínimo ocupado 0.0-1.0 (default: 0.5 = 50%)")
+        print()
+        print("Exemplos:")
+        print("  python analisar_pontas.py grupos/6032")
+        print("  python analisar_pontas.py grupos/6032 20")
+        print("  python analisar_pontas.py grupos/6032 10 --min-length 10 --min-occupied 0.8")
+        print("  python analisar_pontas.py grupos/6032 5 --min-occupied 1.0  # apenas 100% ocupado")
+        print()
+        print("Estratégia:")
+        print("  Se uma sequência tem o MEIO ocupado (contempladas ou não-disponíveis),")
+        print("  basta comprar as PONTAS (2 cotas) para cobrir toda a região!")
+        print()
+        print("  Exemplo: Sequência 100-110")
+        print("    Meio (101-109): 8 contempladas + 1 não-disponível = 100% ocupado")
+        print("    Pontas: 100 e 110 disponíveis")
+        print("    Investimento: 2 cotas cobrindo 11 posições!")
+        return
+    
+    grupo_path = sys.argv[1]
+    top_n = 10
+    min_length = 5
+    min_occupied_pct = 0.5
+    
+    # Parse argumentos
+    i = 2
+    while i < len(sys.argv):
+        if sys.argv[i] == '--min-length' and i + 1 < len(sys.argv):
+            min_length = int(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == '--min-occupied' and i + 1 < len(sys.argv):
+            min_occupied_pct = float(sys.argv[i + 1])
+            i += 2
+        else:
+            top_n = int(sys.argv[i])
+            i += 1
+    
+    analyze_edge_opportunities(grupo_path, top_n=top_n, min_length=min_length, 
+                              min_occupied_pct=min_occupied_pct)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,334 +1,531 @@
-"""
-Consórcio Optimal Cota Strategy Analyzer
-
-Analyzes grupo data to identify optimal cotas based on the alternating search algorithm.
-
-Algorithm: When invalid cota drawn, search alternates: -1, +1, -2, +2, -3, +3...
-(searches BELOW first, then ABOVE)
-"""
-
-import os
-import sys
-from typing import List, Tuple, Set, Dict
-
-
-def load_contempladas(grupo_path: str) -> Set[int]:
-    """Load already selected cotas (GREEN) - INVALID for selection"""
-    contempladas = set()
-    file_path = os.path.join(grupo_path, 'cotas_contempladas.txt')
-
-    if os.path.exists(file_path):
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                # Files contain plain numbers, one per line (no arrow format)
-                if line and line.isdigit():
-                    contempladas.add(int(line))
-
-    return contempladas
-
-
-def load_disponiveis(grupo_path: str) -> Set[int]:
-    """Load available but not purchased cotas (YELLOW) - INVALID for selection"""
-    disponiveis = set()
-    file_path = os.path.join(grupo_path, 'cotas_disponiveis.txt')
-
-    if os.path.exists(file_path):
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                # Files contain plain numbers, one per line (no arrow format)
-                if line and line.isdigit():
-                    disponiveis.add(int(line))
-
-    return disponiveis
-
-
-def get_active_cotas(total_cotas: int, contempladas: Set[int],
-                     disponiveis: Set[int]) -> Set[int]:
-    """Active cotas (BLUE+RED) = all - contempladas - disponiveis"""
-    all_cotas = set(range(1, total_cotas + 1))
-    return all_cotas - contempladas - disponiveis
-
-
-def find_selected_cota(initial_draw: int, active_cotas: Set[int],
-                       max_cota: int) -> int:
-    """
-    Simulate selection algorithm: -1, +1, -2, +2, -3, +3...
-    (searches BELOW first, then ABOVE)
-    """
-    if initial_draw in active_cotas:
-        return initial_draw
-
-    for offset in range(1, max_cota):
-        # Try below FIRST (-)
-        below = initial_draw - offset
-        if below >= 1 and below in active_cotas:
-            return below
-
-        # Then try above (+)
-        above = initial_draw + offset
-        if above <= max_cota and above in active_cotas:
-            return above
-
-    return None
-
-
-def calculate_catchment(cota: int, active_cotas: Set[int],
-                        max_cota: int) -> Tuple[int, List[int]]:
-    """
-    Count how many initial draws result in this cota being selected.
-    Returns: (count, list of draws that result in this cota)
-    """
-    if cota not in active_cotas:
-        return 0, []
-
-    draws = []
-    for draw in range(1, max_cota + 1):
-        if find_selected_cota(draw, active_cotas, max_cota) == cota:
-            draws.append(draw)
-
-    return len(draws), draws
-
-
-def find_gaps(active_cotas: Set[int], contempladas: Set[int],
-              disponiveis: Set[int]) -> List[Tuple[int, int, int, int, int]]:
-    """
-    Find gaps (sequences of invalid cotas).
-    Returns: (start, end, size, num_contempladas, num_disponiveis)
-    Gaps with more contempladas are safer (less risk of someone buying in the gap)
-    """
-    sorted_active = sorted(active_cotas)
-    gaps = []
-
-    for i in range(len(sorted_active) - 1):
-        gap_start = sorted_active[i] + 1
-        gap_end = sorted_active[i + 1] - 1
-
-        if gap_end >= gap_start:
-            # Count contempladas and disponiveis in this gap
-            num_contempladas = sum(1 for c in range(gap_start, gap_end + 1) if c in contempladas)
-            num_disponiveis = sum(1 for c in range(gap_start, gap_end + 1) if c in disponiveis)
-
-            gaps.append((gap_start, gap_end, gap_end - gap_start + 1,
-                        num_contempladas, num_disponiveis))
-
-    return gaps
-
-
-def main():
-    # Parse command line arguments
-    if len(sys.argv) < 2:
-        print("Usage: python3 analyze_optimal_cotas.py <grupo_folder> [total_cotas]")
-        print("Example: python3 analyze_optimal_cotas.py grupos/6032 2500")
-        sys.exit(1)
-
-    grupo = sys.argv[1]
-    total_cotas = int(sys.argv[2]) if len(sys.argv) > 2 else 2500
-
-    grupo_name = os.path.basename(grupo)
-    print("="*70)
-    print(f"CONSÓRCIO STRATEGY ANALYZER - Grupo {grupo_name}")
-    print("="*70)
-
-    # Load data
-    contempladas = load_contempladas(grupo)
-    disponiveis = load_disponiveis(grupo)
-    active = get_active_cotas(total_cotas, contempladas, disponiveis)
-
-    print(f"\n📊 Statistics:")
-    print(f"  Total cotas: {total_cotas}")
-    print(f"  Contempladas (green): {len(contempladas)} ({len(contempladas)/total_cotas*100:.1f}%)")
-    print(f"  Disponíveis (yellow): {len(disponiveis)} ({len(disponiveis)/total_cotas*100:.1f}%)")
-    print(f"  Active (blue+red): {len(active)} ({len(active)/total_cotas*100:.1f}%)")
-
-    # Find all gaps
-    all_gaps = find_gaps(active, contempladas, disponiveis)
-
-    # Analyze gaps - we can buy disponíveis INSIDE gaps even if boundaries are active
-    analyzed_gaps = []
-    for gap_start, gap_end, size, num_contempladas, num_disponiveis in all_gaps:
-        lower_boundary = gap_start - 1
-        upper_boundary = gap_end + 1
-
-        lower_buyable = lower_boundary in disponiveis
-        upper_buyable = upper_boundary in disponiveis
-        lower_active = lower_boundary in active
-        upper_active = upper_boundary in active
-
-        # Find buyable cotas inside this gap
-        buyable_in_gap = [c for c in range(gap_start, gap_end + 1) if c in disponiveis]
-
-        analyzed_gaps.append({
-            'start': gap_start,
-            'end': gap_end,
-            'size': size,
-            'num_contempladas': num_contempladas,
-            'num_disponiveis': num_disponiveis,
-            'lower_boundary': lower_boundary,
-            'upper_boundary': upper_boundary,
-            'lower_buyable': lower_buyable,
-            'upper_buyable': upper_buyable,
-            'lower_active': lower_active,
-            'upper_active': upper_active,
-            'buyable_in_gap': buyable_in_gap
-        })
-
-    # Sort by: 1) size (descending), 2) num_contempladas (descending - safer gaps)
-    analyzed_gaps.sort(key=lambda x: (x['size'], x['num_contempladas']), reverse=True)
-
-    print(f"\n{'='*70}")
-    print(f"TOP 10 LARGEST GAPS")
-    print(f"{'='*70}")
-    print(f"\n{'#':<4} {'Gap Range':<18} {'Size':<6} {'Safe':<6} {'Buyable':<9} {'Boundaries':<25}")
-    print("-"*70)
-
-    for i, gap in enumerate(analyzed_gaps[:10], 1):
-        # Safety = % of gap that is contempladas (safer)
-        safety_pct = (gap['num_contempladas'] / gap['size'] * 100) if gap['size'] > 0 else 0
-
-        # Boundary status
-        lower_status = "BUY✓" if gap['lower_buyable'] else ("ACT" if gap['lower_active'] else "CON")
-        upper_status = "BUY✓" if gap['upper_buyable'] else ("ACT" if gap['upper_active'] else "CON")
-        bounds = f"{gap['lower_boundary']}({lower_status}) ← → {gap['upper_boundary']}({upper_status})"
-
-        num_buyable = len(gap['buyable_in_gap'])
-
-        print(f"{i:<4} {gap['start']:4d}-{gap['end']:4d}{'':<8} {gap['size']:<6} {safety_pct:>4.0f}%  {num_buyable:<9} {bounds}")
-
-    # Analyze top 3 gaps in detail
-    print(f"\n{'='*70}")
-    print(f"DETAILED GAP ANALYSIS (Top 3 Gaps)")
-    print(f"{'='*70}")
-
-    for i, gap in enumerate(analyzed_gaps[:3], 1):
-        safety_pct = (gap['num_contempladas'] / gap['size'] * 100) if gap['size'] > 0 else 0
-
-        print(f"\n🎯 Gap #{i}: Cotas {gap['start']}-{gap['end']} (size: {gap['size']}, {safety_pct:.0f}% safe)")
-
-        # Boundary status
-        if gap['lower_buyable']:
-            print(f"   ✓ Lower boundary ({gap['lower_boundary']}) is AVAILABLE TO BUY")
-        elif gap['lower_active']:
-            print(f"   ✗ Lower boundary ({gap['lower_boundary']}) already ACTIVE (someone owns it)")
-        else:
-            print(f"   ✗ Lower boundary ({gap['lower_boundary']}) already CONTEMPLADA")
-
-        if gap['upper_buyable']:
-            print(f"   ✓ Upper boundary ({gap['upper_boundary']}) is AVAILABLE TO BUY")
-        elif gap['upper_active']:
-            print(f"   ✗ Upper boundary ({gap['upper_boundary']}) already ACTIVE (someone owns it)")
-        else:
-            print(f"   ✗ Upper boundary ({gap['upper_boundary']}) already CONTEMPLADA")
-
-        # Show buyable cotas inside the gap
-        if len(gap['buyable_in_gap']) > 0:
-            print(f"\n   📍 Buyable cotas INSIDE this gap: {len(gap['buyable_in_gap'])} cotas")
-            if len(gap['buyable_in_gap']) <= 10:
-                print(f"      → {', '.join(map(str, gap['buyable_in_gap']))}")
-            else:
-                first_5 = ', '.join(map(str, gap['buyable_in_gap'][:5]))
-                last_5 = ', '.join(map(str, gap['buyable_in_gap'][-5:]))
-                print(f"      → {first_5} ... {last_5}")
-            print(f"   💡 Strategy: Buy cotas inside the gap to benefit from draws landing in gap")
-        else:
-            print(f"\n   ⚠️  No buyable cotas inside this gap (all contempladas)")
-
-    # Find best single cotas FROM DISPONÍVEIS (available to buy)
-    print(f"\n{'='*70}")
-    print(f"TOP 10 BUYABLE COTAS (Highest Catchment)")
-    print(f"{'='*70}")
-
-    buyable_cotas = disponiveis
-    print(f"\nCalculating for {len(buyable_cotas)} disponíveis (buyable) cotas...")
-
-    catchments = {}
-    draws_map = {}
-
-    for i, cota in enumerate(sorted(buyable_cotas)):
-        if i % 100 == 0 and i > 0:
-            print(f"  Progress: {i}/{len(buyable_cotas)}")
-
-        # Simulate buying this cota (add to active)
-        temp_active = active | {cota}
-        catch_count, catch_draws = calculate_catchment(cota, temp_active, total_cotas)
-        catchments[cota] = catch_count
-        draws_map[cota] = catch_draws
-
-    top_10 = sorted(catchments.items(), key=lambda x: x[1], reverse=True)[:10]
-
-    print(f"\n{'Rank':<6} {'Cota':<8} {'Catchment':<12} {'Probability':<15} {'vs Random'}")
-    print("-"*70)
-
-    for rank, (cota, catch) in enumerate(top_10, 1):
-        prob = (catch / total_cotas) * 100
-        mult = catch
-        print(f"{rank:<6} {cota:<8} {catch:<12} {prob:>6.3f}%{'':<8} {mult:.1f}x")
-
-    # Show which draws make each top cota win
-    print(f"\n{'='*70}")
-    print(f"DRAW ANALYSIS FOR TOP 5 BUYABLE COTAS")
-    print(f"{'='*70}")
-
-    for rank, (cota, catch) in enumerate(top_10[:5], 1):
-        draws = draws_map[cota]
-        print(f"\n#{rank} - Cota {cota} ({catch} draws):")
-
-        # Show draws in compact format
-        if len(draws) <= 20:
-            print(f"  Draws: {', '.join(map(str, draws))}")
-        else:
-            # Show first 10 and last 10
-            first_10 = ', '.join(map(str, draws[:10]))
-            last_10 = ', '.join(map(str, draws[-10:]))
-            print(f"  Draws: {first_10} ... {last_10}")
-            print(f"  (showing first 10 and last 10 of {len(draws)} total)")
-
-    # Recommendations
-    print(f"\n{'='*70}")
-    print(f"🎯 STRATEGIC RECOMMENDATIONS")
-    print(f"{'='*70}")
-
-    if analyzed_gaps:
-        best_gap = analyzed_gaps[0]
-        safety_pct = (best_gap['num_contempladas'] / best_gap['size'] * 100) if best_gap['size'] > 0 else 0
-
-        print(f"\n✅ GAP STRATEGY: Target the largest gap")
-        print(f"   Gap: Cotas {best_gap['start']}-{best_gap['end']} (size: {best_gap['size']}, {safety_pct:.0f}% safe)")
-
-        if best_gap['lower_buyable'] and best_gap['upper_buyable']:
-            print(f"\n   🎯 BEST: Buy BOTH boundaries")
-            print(f"   → Cotas: {best_gap['lower_boundary']} AND {best_gap['upper_boundary']}")
-            print(f"   → Captures nearly ALL draws landing in gap")
-        elif best_gap['lower_buyable']:
-            print(f"\n   🎯 Buy lower boundary: Cota {best_gap['lower_boundary']}")
-        elif best_gap['upper_buyable']:
-            print(f"\n   🎯 Buy upper boundary: Cota {best_gap['upper_boundary']}")
-        elif len(best_gap['buyable_in_gap']) > 0:
-            print(f"\n   ⚠️  Boundaries already owned by others")
-            print(f"   💡 Alternative: Buy cotas INSIDE the gap")
-            print(f"   → {len(best_gap['buyable_in_gap'])} buyable cotas available")
-            print(f"   → These cotas benefit from proximity to the gap boundaries")
-            if len(best_gap['buyable_in_gap']) <= 5:
-                print(f"   → Recommended: {', '.join(map(str, best_gap['buyable_in_gap']))}")
-            else:
-                # Show middle cotas (most benefit from both boundaries)
-                middle_idx = len(best_gap['buyable_in_gap']) // 2
-                middle_cotas = best_gap['buyable_in_gap'][max(0, middle_idx-2):middle_idx+3]
-                print(f"   → Recommended (middle of gap): {', '.join(map(str, middle_cotas))}")
-
-    if top_10:
-        best_cota, best_catch = top_10[0]
-        best_draws = draws_map[best_cota]
-        print(f"\n✅ BEST SINGLE BUYABLE COTA: {best_cota}")
-        print(f"   → Catchment: {best_catch} draws")
-        print(f"   → Probability: {(best_catch/total_cotas)*100:.2f}%")
-        print(f"   → {best_catch}x better than random")
-        if len(best_draws) <= 10:
-            print(f"   → Wins on draws: {', '.join(map(str, best_draws))}")
-
-    print(f"\n{'='*70}")
-
-
-if __name__ == "__main__":
-    main()
+"""
+Consórcio Optimal Cota Strategy Analyzer
+
+Analyzes grupo data to identify optimal cotas based on the alternating search algorithm.
+
+Algorithm: When invalid cota drawn, search alternates: -1, +1, -2, +2, -3, +3...
+(searches BELOW first, then ABOVE)
+"""
+
+import heapq
+import io
+import os
+import sys
+from typing import List, Tuple, Dict
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the plain NumPy sweep is used instead
+    njit = None
+    prange = range
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _fill_gap_halves(sel, sorted_active):
+        """Fill interior gaps of the draw->cota map (native loop over gaps)"""
+        for i in range(len(sorted_active) - 1):
+            a = sorted_active[i]
+            b = sorted_active[i + 1]
+            if b - a <= 1:
+                continue
+            mid = (a + b) // 2
+            sel[a + 1:mid + 1] = a
+            sel[mid + 1:b] = b
+    @njit(cache=True, parallel=True)
+    def _all_catchments_numba(sorted_active, candidates, max_cota):
+        """Catchment count per candidate, candidates split across cores"""
+        out = np.empty(candidates.size, dtype=np.int64)
+        for i in prange(candidates.size):
+            c = candidates[i]
+            j = np.searchsorted(sorted_active, c)
+            lo = (sorted_active[j - 1] + c) // 2 + 1 if j > 0 else 1
+            hi = (c + sorted_active[j]) // 2 if j < sorted_active.size else max_cota
+            out[i] = hi - lo + 1
+        return out
+else:
+    _fill_gap_halves = None
+    _all_catchments_numba = None
+
+
+def load_mask(file_path: str, max_cota: int) -> np.ndarray:
+    """Load an integer-per-line file as a cota-indexed boolean bitmap"""
+    mask = np.zeros(max_cota + 2, dtype=bool)
+
+    if os.path.exists(file_path):
+        # Single slurp + bulk parse instead of per-line strip/isdigit/int
+        with open(file_path, 'r', encoding='utf-8') as f:
+            tokens = f.read().split()
+
+        # Files contain plain numbers, one per line (no arrow format)
+        cotas = np.fromiter((int(t) for t in tokens if t.isdigit()),
+                            dtype=np.int64)
+        cotas = cotas[(cotas >= 1) & (cotas <= max_cota)]
+        mask[cotas] = True
+
+    return mask
+
+
+def load_contempladas(grupo_path: str, max_cota: int) -> np.ndarray:
+    """Load already selected cotas (GREEN) - INVALID for selection"""
+    return load_mask(os.path.join(grupo_path, 'cotas_contempladas.txt'), max_cota)
+
+
+def load_disponiveis(grupo_path: str, max_cota: int) -> np.ndarray:
+    """Load available but not purchased cotas (YELLOW) - INVALID for selection"""
+    return load_mask(os.path.join(grupo_path, 'cotas_disponiveis.txt'), max_cota)
+
+
+def get_active_cotas(total_cotas: int, contempladas: np.ndarray,
+                     disponiveis: np.ndarray) -> np.ndarray:
+    """Active cotas (BLUE+RED) = all - contempladas - disponiveis, as a bitmap"""
+    active = ~contempladas & ~disponiveis
+    active[0] = False
+    active[total_cotas + 1:] = False
+    return active
+
+
+def compute_neighbor_maps(active_cotas: np.ndarray,
+                          max_cota: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Precompute, for every cota d, the nearest active cota at or below d and
+    at or above d (0 where none exists), via two accumulate passes.
+
+    Passing the pair to find_selected_cota makes each call O(1): two array
+    loads and one comparison, no binary search.
+    """
+    idx = np.arange(max_cota + 1, dtype=np.int32)
+    active = active_cotas[:max_cota + 1]
+
+    next_below = np.maximum.accumulate(np.where(active, idx, 0)).astype(np.int32)
+
+    sentinel = max_cota + 1
+    above_rev = np.minimum.accumulate(np.where(active, idx, sentinel)[::-1])[::-1]
+    next_above = np.where(above_rev == sentinel, 0, above_rev).astype(np.int32)
+
+    return next_below, next_above
+
+
+def find_selected_cota(initial_draw: int, active_cotas: np.ndarray,
+                       max_cota: int, sorted_active: np.ndarray = None,
+                       neighbors: Tuple[np.ndarray, np.ndarray] = None) -> int:
+    """
+    Selection algorithm: -1, +1, -2, +2, -3, +3... (searches BELOW first,
+    then ABOVE). The alternating scan is equivalent to picking the nearest
+    active cota with ties going below, so a binary search over the sorted
+    active cotas resolves it in O(log N) instead of up to max_cota probes —
+    or O(1) when the precomputed neighbor maps are passed in.
+    """
+    if active_cotas[initial_draw]:
+        return initial_draw
+
+    if neighbors is not None:
+        next_below, next_above = neighbors
+        below = int(next_below[initial_draw])
+        above = int(next_above[initial_draw])
+        if below == 0:
+            return above if above else None
+        if above == 0:
+            return below
+        return below if initial_draw - below <= above - initial_draw else above
+
+    if sorted_active is None:
+        sorted_active = np.flatnonzero(active_cotas)
+    if sorted_active.size == 0:
+        return None
+
+    i = int(np.searchsorted(sorted_active, initial_draw))
+    if i == 0:
+        return int(sorted_active[0])
+    if i == sorted_active.size:
+        return int(sorted_active[-1])
+
+    below = int(sorted_active[i - 1])
+    above = int(sorted_active[i])
+    return below if initial_draw - below <= above - initial_draw else above
+
+
+def compute_selected_map(active_cotas: np.ndarray, max_cota: int) -> np.ndarray:
+    """
+    Build a draw->selected-cota lookup table in one sweep over the sorted
+    active cotas.
+
+    For a draw d in the gap between consecutive active cotas a < b, the
+    alternating search (-1, +1, -2, +2...) selects a when d-a <= b-d (below
+    wins ties) and b otherwise, so each gap splits at its midpoint. Draws
+    before the first / after the last active cota map to that boundary cota.
+
+    Returns: int32 array sel of size max_cota+1 where sel[d] is the selected
+    cota for draw d (sel[0] unused, 0 where no active cota exists).
+    """
+    sel = np.zeros(max_cota + 1, dtype=np.int32)
+    sorted_active = np.flatnonzero(active_cotas).astype(np.int32)
+    if sorted_active.size == 0:
+        return sel
+
+    # Active cotas select themselves; draws below the first / above the last
+    # active cota map to that boundary cota
+    sel[sorted_active] = sorted_active
+    first, last = int(sorted_active[0]), int(sorted_active[-1])
+    sel[1:first] = first
+    sel[last + 1:] = last
+
+    # Each interior gap (a, b): left half (ties included) -> a, right half -> b
+    if _fill_gap_halves is not None:
+        _fill_gap_halves(sel, sorted_active)
+    else:
+        for i in range(len(sorted_active) - 1):
+            a = int(sorted_active[i])
+            b = int(sorted_active[i + 1])
+            if b - a <= 1:
+                continue
+            mid = (a + b) // 2
+            sel[a + 1:mid + 1] = a
+            sel[mid + 1:b] = b
+
+    return sel
+
+
+def calculate_catchment(cota: int, active_cotas: np.ndarray,
+                        max_cota: int, sel: np.ndarray = None) -> Tuple[int, List[int]]:
+    """
+    Count how many initial draws result in this cota being selected.
+    Returns: (count, list of draws that result in this cota)
+    """
+    if not active_cotas[cota]:
+        return 0, []
+
+    if sel is None:
+        sel = compute_selected_map(active_cotas, max_cota)
+
+    # sel is indexed by draw, so the matching indices ARE the draws
+    draws = np.flatnonzero(sel == cota).tolist()
+    return len(draws), draws
+
+
+def _catchment_bounds(cota: int, sorted_active: np.ndarray,
+                      max_cota: int) -> Tuple[int, int]:
+    """
+    Draw range a currently-inactive cota would capture if bought, without
+    rebuilding the draw->cota map.
+
+    Inserting cota c between active neighbors a < c < b only re-routes draws
+    inside (a, b): c captures ((a+c)//2, (c+b)//2], a contiguous range (ties
+    go below, same rule as compute_selected_map). Without a neighbor the
+    range extends to 1 / max_cota.
+    """
+    i = int(np.searchsorted(sorted_active, cota))
+    below = int(sorted_active[i - 1]) if i > 0 else None
+    above = int(sorted_active[i]) if i < sorted_active.size else None
+
+    left_lo = (below + cota) // 2 + 1 if below is not None else 1
+    right_hi = (cota + above) // 2 if above is not None else max_cota
+
+    return left_lo, right_hi
+
+
+def count_catchment_if_bought(cota: int, sorted_active: np.ndarray,
+                              max_cota: int) -> int:
+    """Count-only variant of catchment_if_bought: no draws list is built"""
+    left_lo, right_hi = _catchment_bounds(cota, sorted_active, max_cota)
+    return right_hi - left_lo + 1
+
+
+def all_catchments(sorted_active: np.ndarray, candidates: np.ndarray,
+                   max_cota: int) -> np.ndarray:
+    """
+    Catchment counts for every candidate cota in one batch: a Numba prange
+    kernel across cores when available, otherwise a fully vectorized
+    searchsorted over all candidates at once.
+    """
+    if sorted_active.size == 0:
+        return np.full(candidates.size, max_cota, dtype=np.int64)
+
+    if _all_catchments_numba is not None:
+        return _all_catchments_numba(sorted_active.astype(np.int64),
+                                     candidates.astype(np.int64), max_cota)
+
+    idx = np.searchsorted(sorted_active, candidates)
+    lo = np.where(idx > 0,
+                  (sorted_active[np.maximum(idx - 1, 0)] + candidates) // 2 + 1, 1)
+    hi = np.where(idx < sorted_active.size,
+                  (candidates + sorted_active[np.minimum(idx, sorted_active.size - 1)]) // 2,
+                  max_cota)
+    return (hi - lo + 1).astype(np.int64)
+
+
+def catchment_if_bought(cota: int, sorted_active: np.ndarray,
+                        max_cota: int) -> Tuple[int, List[int]]:
+    """
+    As count_catchment_if_bought, but also materializes the draws.
+    Returns: (count, list of draws that would select this cota)
+    """
+    left_lo, right_hi = _catchment_bounds(cota, sorted_active, max_cota)
+    return right_hi - left_lo + 1, list(range(left_lo, right_hi + 1))
+
+
+def find_gaps(active_cotas: np.ndarray, contempladas: np.ndarray,
+              disponiveis: np.ndarray) -> List[Tuple[int, int, int, int, int]]:
+    """
+    Find gaps (sequences of invalid cotas).
+    Returns: (start, end, size, num_contempladas, num_disponiveis)
+    Gaps with more contempladas are safer (less risk of someone buying in the gap)
+    """
+    sorted_active = np.flatnonzero(active_cotas).astype(np.int32)
+    if sorted_active.size < 2:
+        return []
+
+    # Gap boundaries from consecutive active cotas, all at once
+    starts = sorted_active[:-1] + 1
+    ends = sorted_active[1:] - 1
+    keep = ends >= starts
+    starts, ends = starts[keep], ends[keep]
+    if starts.size == 0:
+        return []
+
+    # Prefix sums over the cota-indexed bitmaps: counting contempladas /
+    # disponiveis inside every gap becomes two array lookups per gap
+    cum_c = np.cumsum(contempladas)
+    cum_d = np.cumsum(disponiveis)
+
+    num_contempladas = cum_c[ends] - cum_c[starts - 1]
+    num_disponiveis = cum_d[ends] - cum_d[starts - 1]
+    sizes = ends - starts + 1
+
+    return list(zip(starts.tolist(), ends.tolist(), sizes.tolist(),
+                    num_contempladas.tolist(), num_disponiveis.tolist()))
+
+
+def main():
+    # Parse command line arguments
+    if len(sys.argv) < 2:
+        print("Usage: python3 analyze_optimal_cotas.py <grupo_folder> [total_cotas]")
+        print("Example: python3 analyze_optimal_cotas.py grupos/6032 2500")
+        sys.exit(1)
+
+    grupo = sys.argv[1]
+    total_cotas = int(sys.argv[2]) if len(sys.argv) > 2 else 2500
+
+    # Report lines are buffered and written to stdout in one call at the end;
+    # avoids a write per print
+    out = io.StringIO()
+
+    grupo_name = os.path.basename(grupo)
+    print("="*70, file=out)
+    print(f"CONSÓRCIO STRATEGY ANALYZER - Grupo {grupo_name}", file=out)
+    print("="*70, file=out)
+
+    # Load data as cota-indexed bitmaps
+    contempladas = load_contempladas(grupo, total_cotas)
+    disponiveis = load_disponiveis(grupo, total_cotas)
+    active = get_active_cotas(total_cotas, contempladas, disponiveis)
+
+    num_contempladas = int(contempladas.sum())
+    num_disponiveis = int(disponiveis.sum())
+    num_active = int(active.sum())
+
+    print(f"\n📊 Statistics:", file=out)
+    print(f"  Total cotas: {total_cotas}", file=out)
+    print(f"  Contempladas (green): {num_contempladas} ({num_contempladas/total_cotas*100:.1f}%)", file=out)
+    print(f"  Disponíveis (yellow): {num_disponiveis} ({num_disponiveis/total_cotas*100:.1f}%)", file=out)
+    print(f"  Active (blue+red): {num_active} ({num_active/total_cotas*100:.1f}%)", file=out)
+
+    # Find all gaps
+    all_gaps = find_gaps(active, contempladas, disponiveis)
+
+    # Rank gaps on NumPy columns; dicts (boundary flags, buyable lists) are
+    # only materialized for the 10 gaps the report actually shows
+    analyzed_gaps = []
+    if all_gaps:
+        g_starts, g_ends, g_sizes, g_contemp, g_disp = (
+            np.array(col, dtype=np.int32) for col in zip(*all_gaps))
+
+        # Sort by: 1) size (descending), 2) num_contempladas (descending - safer
+        # gaps); the index column keeps the stable tie order of list.sort
+        order = np.lexsort((np.arange(g_sizes.size), -g_contemp, -g_sizes))[:10]
+
+        # We can buy disponíveis INSIDE gaps even if boundaries are active
+        for idx in order:
+            gap_start = int(g_starts[idx])
+            gap_end = int(g_ends[idx])
+            lower_boundary = gap_start - 1
+            upper_boundary = gap_end + 1
+
+            # Find buyable cotas inside this gap (slice + flatnonzero, no per-cota loop)
+            buyable_in_gap = (np.flatnonzero(disponiveis[gap_start:gap_end + 1])
+                              + gap_start).tolist()
+
+            analyzed_gaps.append({
+                'start': gap_start,
+                'end': gap_end,
+                'size': int(g_sizes[idx]),
+                'num_contempladas': int(g_contemp[idx]),
+                'num_disponiveis': int(g_disp[idx]),
+                'lower_boundary': lower_boundary,
+                'upper_boundary': upper_boundary,
+                'lower_buyable': bool(disponiveis[lower_boundary]),
+                'upper_buyable': bool(disponiveis[upper_boundary]),
+                'lower_active': bool(active[lower_boundary]),
+                'upper_active': bool(active[upper_boundary]),
+                'buyable_in_gap': buyable_in_gap
+            })
+
+    print(f"\n{'='*70}", file=out)
+    print(f"TOP 10 LARGEST GAPS", file=out)
+    print(f"{'='*70}", file=out)
+    print(f"\n{'#':<4} {'Gap Range':<18} {'Size':<6} {'Safe':<6} {'Buyable':<9} {'Boundaries':<25}", file=out)
+    print("-"*70, file=out)
+
+    for i, gap in enumerate(analyzed_gaps[:10], 1):
+        # Safety = % of gap that is contempladas (safer)
+        safety_pct = (gap['num_contempladas'] / gap['size'] * 100) if gap['size'] > 0 else 0
+
+        # Boundary status
+        lower_status = "BUY✓" if gap['lower_buyable'] else ("ACT" if gap['lower_active'] else "CON")
+        upper_status = "BUY✓" if gap['upper_buyable'] else ("ACT" if gap['upper_active'] else "CON")
+        bounds = f"{gap['lower_boundary']}({lower_status}) ← → {gap['upper_boundary']}({upper_status})"
+
+        num_buyable = len(gap['buyable_in_gap'])
+
+        print(f"{i:<4} {gap['start']:4d}-{gap['end']:4d}{'':<8} {gap['size']:<6} {safety_pct:>4.0f}%  {num_buyable:<9} {bounds}", file=out)
+
+    # Analyze top 3 gaps in detail
+    print(f"\n{'='*70}", file=out)
+    print(f"DETAILED GAP ANALYSIS (Top 3 Gaps)", file=out)
+    print(f"{'='*70}", file=out)
+
+    for i, gap in enumerate(analyzed_gaps[:3], 1):
+        safety_pct = (gap['num_contempladas'] / gap['size'] * 100) if gap['size'] > 0 else 0
+
+        print(f"\n🎯 Gap #{i}: Cotas {gap['start']}-{gap['end']} (size: {gap['size']}, {safety_pct:.0f}% safe)", file=out)
+
+        # Boundary status
+        if gap['lower_buyable']:
+            print(f"   ✓ Lower boundary ({gap['lower_boundary']}) is AVAILABLE TO BUY", file=out)
+        elif gap['lower_active']:
+            print(f"   ✗ Lower boundary ({gap['lower_boundary']}) already ACTIVE (someone owns it)", file=out)
+        else:
+            print(f"   ✗ Lower boundary ({gap['lower_boundary']}) already CONTEMPLADA", file=out)
+
+        if gap['upper_buyable']:
+            print(f"   ✓ Upper boundary ({gap['upper_boundary']}) is AVAILABLE TO BUY", file=out)
+        elif gap['upper_active']:
+            print(f"   ✗ Upper boundary ({gap['upper_boundary']}) already ACTIVE (someone owns it)", file=out)
+        else:
+            print(f"   ✗ Upper boundary ({gap['upper_boundary']}) already CONTEMPLADA", file=out)
+
+        # Show buyable cotas inside the gap
+        if len(gap['buyable_in_gap']) > 0:
+            print(f"\n   📍 Buyable cotas INSIDE this gap: {len(gap['buyable_in_gap'])} cotas", file=out)
+            if len(gap['buyable_in_gap']) <= 10:
+                print(f"      → {', '.join(map(str, gap['buyable_in_gap']))}", file=out)
+            else:
+                first_5 = ', '.join(map(str, gap['buyable_in_gap'][:5]))
+                last_5 = ', '.join(map(str, gap['buyable_in_gap'][-5:]))
+                print(f"      → {first_5} ... {last_5}", file=out)
+            print(f"   💡 Strategy: Buy cotas inside the gap to benefit from draws landing in gap", file=out)
+        else:
+            print(f"\n   ⚠️  No buyable cotas inside this gap (all contempladas)", file=out)
+
+    # Find best single cotas FROM DISPONÍVEIS (available to buy)
+    print(f"\n{'='*70}", file=out)
+    print(f"TOP 10 BUYABLE COTAS (Highest Catchment)", file=out)
+    print(f"{'='*70}", file=out)
+
+    buyable_cotas = [int(c) for c in np.flatnonzero(disponiveis)]
+    print(f"\nCalculating for {len(buyable_cotas)} disponíveis (buyable) cotas...", file=out)
+
+    # Buying a cota only re-routes draws inside its surrounding gap, so each
+    # candidate is O(1) against the sorted active cotas — all candidates are
+    # counted in one batch (multi-core under numba). Draws lists are built
+    # just for the top 10
+    sorted_active = np.flatnonzero(active)
+    counts = all_catchments(sorted_active, np.flatnonzero(disponiveis), total_cotas)
+    catchments = dict(zip(buyable_cotas, counts.tolist()))
+
+    # nlargest is O(N log 10) and documented as equivalent to
+    # sorted(..., reverse=True)[:10], including tie order
+    top_10 = heapq.nlargest(10, catchments.items(), key=lambda x: x[1])
+
+    draws_map = {cota: catchment_if_bought(cota, sorted_active, total_cotas)[1]
+                 for cota, _ in top_10}
+
+    print(f"\n{'Rank':<6} {'Cota':<8} {'Catchment':<12} {'Probability':<15} {'vs Random'}", file=out)
+    print("-"*70, file=out)
+
+    for rank, (cota, catch) in enumerate(top_10, 1):
+        prob = (catch / total_cotas) * 100
+        mult = catch
+        print(f"{rank:<6} {cota:<8} {catch:<12} {prob:>6.3f}%{'':<8} {mult:.1f}x", file=out)
+
+    # Show which draws make each top cota win
+    print(f"\n{'='*70}", file=out)
+    print(f"DRAW ANALYSIS FOR TOP 5 BUYABLE COTAS", file=out)
+    print(f"{'='*70}", file=out)
+
+    for rank, (cota, catch) in enumerate(top_10[:5], 1):
+        draws = draws_map[cota]
+        print(f"\n#{rank} - Cota {cota} ({catch} draws):", file=out)
+
+        # Show draws in compact format
+        if len(draws) <= 20:
+            print(f"  Draws: {', '.join(map(str, draws))}", file=out)
+        else:
+            # Show first 10 and last 10
+            first_10 = ', '.join(map(str, draws[:10]))
+            last_10 = ', '.join(map(str, draws[-10:]))
+            print(f"  Draws: {first_10} ... {last_10}", file=out)
+            print(f"  (showing first 10 and last 10 of {len(draws)} total)", file=out)
+
+    # Recommendations
+    print(f"\n{'='*70}", file=out)
+    print(f"🎯 STRATEGIC RECOMMENDATIONS", file=out)
+    print(f"{'='*70}", file=out)
+
+    if analyzed_gaps:
+        best_gap = analyzed_gaps[0]
+        safety_pct = (best_gap['num_contempladas'] / best_gap['size'] * 100) if best_gap['size'] > 0 else 0
+
+        print(f"\n✅ GAP STRATEGY: Target the largest gap", file=out)
+        print(f"   Gap: Cotas {best_gap['start']}-{best_gap['end']} (size: {best_gap['size']}, {safety_pct:.0f}% safe)", file=out)
+
+        if best_gap['lower_buyable'] and best_gap['upper_buyable']:
+            print(f"\n   🎯 BEST: Buy BOTH boundaries", file=out)
+            print(f"   → Cotas: {best_gap['lower_boundary']} AND {best_gap['upper_boundary']}", file=out)
+            print(f"   → Captures nearly ALL draws landing in gap", file=out)
+        elif best_gap['lower_buyable']:
+            print(f"\n   🎯 Buy lower boundary: Cota {best_gap['lower_boundary']}", file=out)
+        elif best_gap['upper_buyable']:
+            print(f"\n   🎯 Buy upper boundary: Cota {best_gap['upper_boundary']}", file=out)
+        elif len(best_gap['buyable_in_gap']) > 0:
+            print(f"\n   ⚠️  Boundaries already owned by others", file=out)
+            print(f"   💡 Alternative: Buy cotas INSIDE the gap", file=out)
+            print(f"   → {len(best_gap['buyable_in_gap'])} buyable cotas available", file=out)
+            print(f"   → These cotas benefit from proximity to the gap boundaries", file=out)
+            if len(best_gap['buyable_in_gap']) <= 5:
+                print(f"   → Recommended: {', '.join(map(str, best_gap['buyable_in_gap']))}", file=out)
+            else:
+                # Show middle cotas (most benefit from both boundaries)
+                middle_idx = len(best_gap['buyable_in_gap']) // 2
+                middle_cotas = best_gap['buyable_in_gap'][max(0, middle_idx-2):middle_idx+3]
+                print(f"   → Recommended (middle of gap): {', '.join(map(str, middle_cotas))}", file=out)
+
+    if top_10:
+        best_cota, best_catch = top_10[0]
+        best_draws = draws_map[best_cota]
+        print(f"\n✅ BEST SINGLE BUYABLE COTA: {best_cota}", file=out)
+        print(f"   → Catchment: {best_catch} draws", file=out)
+        print(f"   → Probability: {(best_catch/total_cotas)*100:.2f}%", file=out)
+        print(f"   → {best_catch}x better than random", file=out)
+        if len(best_draws) <= 10:
+            print(f"   → Wins on draws: {', '.join(map(str, best_draws))}", file=out)
+
+    print(f"\n{'='*70}", file=out)
+
+    sys.stdout.write(out.getvalue())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+"""Código compartilhado entre os scripts de análise de consórcio."""
+
+from .data_loader import load_group_data
+
+__all__ = ['load_group_data']
@@ -0,0 +1,160 @@
+"""
+Carregamento compartilhado dos dados de grupo (configuração, contempladas,
+disponíveis), com parse vetorizado e cache em disco por mtime.
+
+Usado por analisar_pontas.py e analisar_sequencias.py — qualquer correção ou
+otimização de IO passa a valer para os dois scripts automaticamente.
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  # parser de CSV mais rápido, quando instalado
+    _CSV_ENGINE = 'pyarrow'
+except ImportError:
+    _CSV_ENGINE = 'c'
+
+
+_GROUP_INPUT_FILES = ("configuracao.json", "total_cotas.txt", "cotas_contempladas.csv",
+                      "cotas_contempladas.txt", "cotas_disponiveis.txt")
+
+
+def _read_int_file(path) -> np.ndarray:
+    """Lê arquivo com um inteiro por linha (comentários '#') como ndarray int32."""
+    try:
+        return pd.read_csv(path, header=None, comment='#', dtype=np.int32,
+                           engine='c').iloc[:, 0].to_numpy()
+    except pd.errors.EmptyDataError:
+        return np.empty(0, dtype=np.int32)
+
+
+def _cache_key(grupo_dir: Path) -> dict:
+    """Chave do cache em disco: mtime de cada arquivo de entrada existente."""
+    return {name: (grupo_dir / name).stat().st_mtime
+            for name in _GROUP_INPUT_FILES if (grupo_dir / name).exists()}
+
+
+def _parse_group_files(grupo_dir: Path):
+    """Parseia os arquivos do grupo, retornando (total, contempladas, disponíveis)."""
+    # Carregar total de cotas
+    config_file = grupo_dir / "configuracao.json"
+    total_file = grupo_dir / "total_cotas.txt"
+
+    if config_file.exists():
+        with open(config_file, 'r') as f:
+            config = json.load(f)
+        total_quotas = config['total_cotas']
+    elif total_file.exists():
+        with open(total_file, 'r') as f:
+            total_quotas = int(f.read().strip())
+    else:
+        raise FileNotFoundError("Arquivo de configuração não encontrado")
+
+    # Carregar contempladas
+    contemplated_vals = np.empty(0, dtype=np.int32)
+    contemplated_csv = grupo_dir / "cotas_contempladas.csv"
+    contemplated_txt = grupo_dir / "cotas_contempladas.txt"
+
+    if contemplated_csv.exists():
+        # Expansão vetorizada de "a-b-c" em inteiros, sem loop Python por linha
+        df = pd.read_csv(contemplated_csv, engine=_CSV_ENGINE, dtype={'cotas': str})
+        contemplated_vals = (df['cotas'].dropna().str.split('-').explode()
+                             .str.strip().astype(np.int32).to_numpy())
+    elif contemplated_txt.exists():
+        contemplated_vals = _read_int_file(contemplated_txt)
+
+    # Carregar disponíveis
+    available_vals = np.empty(0, dtype=np.int32)
+    available_file = grupo_dir / "cotas_disponiveis.txt"
+    if available_file.exists():
+        available_vals = _read_int_file(available_file)
+
+    return total_quotas, contemplated_vals, available_vals
+
+
+@lru_cache(maxsize=None)
+def _load_group_arrays(grupo_path: str):
+    """
+    Carrega (total, contempladas, disponíveis) com cache em disco keyed por
+    mtime dos arquivos de entrada; chamadas repetidas no mesmo processo são
+    memoizadas pelo lru_cache.
+    """
+    grupo_dir = Path(grupo_path)
+    key = _cache_key(grupo_dir)
+    cache_dir = grupo_dir / ".cache"
+    npz_file = cache_dir / "data.npz"
+    key_file = cache_dir / "key.json"
+
+    if npz_file.exists() and key_file.exists():
+        try:
+            if json.loads(key_file.read_text()) == key:
+                with np.load(npz_file) as npz:
+                    return (int(npz['total_quotas']),
+                            npz['contemplated'], npz['available'])
+        except Exception:
+            pass  # cache corrompido: reparseia e regrava abaixo
+
+    total_quotas, contemplated_vals, available_vals = _parse_group_files(grupo_dir)
+
+    try:
+        cache_dir.mkdir(exist_ok=True)
+        np.savez(npz_file, total_quotas=total_quotas,
+                 contemplated=contemplated_vals, available=available_vals)
+        key_file.write_text(json.dumps(key))
+    except OSError:
+        pass  # sem permissão de escrita: segue sem cache
+
+    return total_quotas, contemplated_vals, available_vals
+
+
+def load_group_data(grupo_path: str):
+    """Carrega dados do grupo."""
+    total_quotas, contemplated_vals, available_vals = _load_group_arrays(str(Path(grupo_path)))
+
+    # Arrays booleanos indexados pela cota (índices 0 e total+1 ficam False):
+    # toda a álgebra de conjuntos vira operações bit a bit vetorizadas.
+    # Valores fora de 1..total são descartados antes da indexação (fora do
+    # array estourariam; negativos indexariam a partir do fim)
+    contemplated_vals = contemplated_vals[
+        (contemplated_vals >= 1) & (contemplated_vals <= total_quotas)]
+    available_vals = available_vals[
+        (available_vals >= 1) & (available_vals <= total_quotas)]
+
+    contemplated_arr = np.zeros(total_quotas + 2, dtype=bool)
+    contemplated_arr[contemplated_vals] = True
+    available_arr = np.zeros(total_quotas + 2, dtype=bool)
+    available_arr[available_vals] = True
+
+    # Ativas = não contempladas; ocupadas = contempladas + ativas não-disponíveis
+    active_arr = ~contemplated_arr
+    active_arr[0] = active_arr[-1] = False
+    occupied_arr = contemplated_arr | (active_arr & ~available_arr)
+
+    # Somas prefixadas são invariantes do grupo: calcular uma vez aqui em vez
+    # de a cada chamada dos algoritmos de varredura
+    occ_cum = np.cumsum(occupied_arr.astype(np.int32))
+    avail_cum = np.cumsum(available_arr.astype(np.int32))
+
+    # Sets mantidos para exibição e compatibilidade com chamadores existentes
+    contemplated = set(contemplated_vals.tolist())
+    available = set(available_vals.tolist())
+    active = set(np.flatnonzero(active_arr).tolist())
+    occupied = set(np.flatnonzero(occupied_arr).tolist())
+
+    return {
+        'total_quotas': total_quotas,
+        'contemplated': contemplated,
+        'active': active,
+        'available': available,
+        'occupied': occupied,  # cotas que não podem ser compradas
+        'contemplated_arr': contemplated_arr,
+        'active_arr': active_arr,
+        'occupied_arr': occupied_arr,
+        'available_arr': available_arr,
+        'occ_cum': occ_cum,
+        'avail_cum': avail_cum
+    }
@@ -7,13 +7,13 @@ Mostra matriz com status das cotas:
 - Borda Roxa: Top 3 sequências consecutivas (opcional)
 """
 
+import io
 import sys
 import json
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from pathlib import Path
-import pandas as pd
 
 
 def find_consecutive_sequences(quotas_list: list) -> list:
@@ -21,39 +21,48 @@ def find_consecutive_sequences(quotas_list: list) -> list:
     if not quotas_list:
         return []
     
-    sorted_quotas = sorted(set(quotas_list))
-    sequences = []
-    current_seq = [sorted_quotas[0]]
-    
-    for i in range(1, len(sorted_quotas)):
-        prev = sorted_quotas[i - 1]
-        curr = sorted_quotas[i]
-        
-        if curr == prev + 1:
-            current_seq.append(curr)
-        else:
-            if len(current_seq) >= 2:
-                sequences.append({
-                    'quotas': current_seq.copy(),
-                    'start': current_seq[0],
-                    'end': current_seq[-1],
-                    'length': len(current_seq)
-                })
-            current_seq = [curr]
-    
-    if len(current_seq) >= 2:
-        sequences.append({
-            'quotas': current_seq.copy(),
-            'start': current_seq[0],
-            'end': current_seq[-1],
-            'length': len(current_seq)
-        })
-    
+    arr = np.fromiter(set(quotas_list), dtype=np.int32)
+    arr.sort()
+    return find_consecutive_sequences_sorted(arr)
+
+
+def find_consecutive_sequences_sorted(arr: np.ndarray) -> list:
+    """Variante para entrada já ordenada e sem duplicatas (pula o sort)."""
+    if arr.size == 0:
+        return []
+
+    # Detecção de runs vetorizada: quebra onde a diferença entre vizinhos != 1
+    split_idx = np.where(np.diff(arr) != 1)[0] + 1
+    groups = np.split(arr, split_idx)
+
+    sequences = [{
+        'quotas': g.tolist(),
+        'start': int(g[0]),
+        'end': int(g[-1]),
+        'length': len(g)
+    } for g in groups if len(g) >= 2]
+
     # Ordenar por tamanho (maior primeiro) e depois por início (menor primeiro)
     sequences.sort(key=lambda s: (-s['length'], s['start']))
     return sequences
 
 
+def load_int_bitmap(path: Path, n: int) -> np.ndarray:
+    """Lê arquivo de inteiros (um por linha) como bitmap booleano indexado pela cota."""
+    mask = np.zeros(n + 2, dtype=bool)
+    if path.exists():
+        # Arquivo vazio ou só de comentários é válido (bitmap zerado); checar
+        # antes evita o UserWarning "input contained no data" do loadtxt
+        text = path.read_text()
+        has_data = any(line.strip() and not line.lstrip().startswith('#')
+                       for line in text.splitlines())
+        if has_data:
+            vals = np.loadtxt(io.StringIO(text), dtype=np.int32,
+                              comments='#', ndmin=1)
+            mask[vals[(vals >= 1) & (vals <= n)]] = True
+    return mask
+
+
 def load_group_data(grupo_path: str):
     """Carrega dados do grupo."""
     grupo_dir = Path(grupo_path)
@@ -78,37 +87,27 @@ def load_group_data(grupo_path: str):
     contemplated_txt = grupo_dir / "cotas_contempladas.txt"
     
     if contemplated_csv.exists():
+        # pandas só é necessário para o formato CSV; importar aqui evita
+        # pagar o import (centenas de ms) nos grupos que usam apenas .txt
+        import pandas as pd
+
         df = pd.read_csv(contemplated_csv)
         for cotas_str in df['cotas']:
             if pd.notna(cotas_str):
                 for cota in str(cotas_str).split('-'):
                     contemplated.add(int(cota.strip()))
     elif contemplated_txt.exists():
-        with open(contemplated_txt, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    contemplated.add(int(line))
-    
+        # Parse em bloco pelo NumPy: evita decodificar/alocar uma str por linha
+        mask = load_int_bitmap(contemplated_txt, total_quotas)
+        contemplated = set(np.flatnonzero(mask).tolist())
+
     # Carregar disponíveis
-    available = set()
-    available_file = grupo_dir / "cotas_disponiveis.txt"
-    if available_file.exists():
-        with open(available_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    available.add(int(line))
-    
+    available_mask = load_int_bitmap(grupo_dir / "cotas_disponiveis.txt", total_quotas)
+    available = set(np.flatnonzero(available_mask).tolist())
+
     # Carregar lance 25%
-    lance_25 = set()
-    lance_25_file = grupo_dir / "lance_25.txt"
-    if lance_25_file.exists():
-        with open(lance_25_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    lance_25.add(int(line))
+    lance_25_mask = load_int_bitmap(grupo_dir / "lance_25.txt", total_quotas)
+    lance_25 = set(np.flatnonzero(lance_25_mask).tolist())
     
     # Calcular ativas
     all_quotas = set(range(1, total_quotas + 1))
@@ -123,16 +122,17 @@ def load_group_data(grupo_path: str):
     }
 
 
-def visualizar_simples(grupo_path: str, output_path: str = None, show: bool = False, show_numbers: bool = False, highlight_sequences: bool = False):
+def visualizar_simples(grupo_path: str, output_path: str = None, show: bool = False, show_numbers: bool = False, highlight_sequences: bool = False, dpi: int = 100):
     """
     Cria visualização simples em matriz das cotas por status.
-    
+
     Args:
         grupo_path: Caminho para pasta do grupo
         output_path: Caminho para salvar imagem (opcional)
         show: Se True, mostra a janela
         show_numbers: Se True, mostra números das cotas
         highlight_sequences: Se True, destaca as 3 maiores sequências com borda roxa
+        dpi: Resolução da imagem salva (trabalho de rasterização cresce com dpi²)
     """
     grupo_dir = Path(grupo_path)
     if not grupo_dir.exists():
@@ -169,8 +169,11 @@ def visualizar_simples(grupo_path: str, output_path: str = None, show: bool = Fa
     top_sequences = []
     if highlight_sequences and available_active:
         # Incluir contempladas porque se sorteadas, a próxima ±1 é usada
-        quotas_for_sequence = list(data['available'] | data['contemplated'])
-        all_sequences = find_consecutive_sequences(quotas_for_sequence)
+        # np.union1d já devolve ordenado e sem duplicatas, dispensando o sort
+        quotas_for_sequence = np.union1d(
+            np.fromiter(data['available'], dtype=np.int32),
+            np.fromiter(data['contemplated'], dtype=np.int32))
+        all_sequences = find_consecutive_sequences_sorted(quotas_for_sequence)
         
         # Pegar as top 3 MAIORES sequências (incluindo empates)
         if all_sequences:
@@ -194,34 +197,37 @@ def visualizar_simples(grupo_path: str, output_path: str = None, show: bool = Fa
     print(f"Matriz: {rows}x{cols}")
     print()
     
-    # Criar matriz de valores
+    # Bitmaps (índice = cota - 1) para preenchimento e coloração vetorizados
+    def mask_of(quota_set):
+        m = np.zeros(total_quotas, dtype=bool)
+        if quota_set:
+            m[np.fromiter(quota_set, dtype=np.int32) - 1] = True
+        return m
+
+    lance_25_m = mask_of(lance_25)
+    contemplated_m = mask_of(contemplated)
+    available_active_m = mask_of(available_active)
+    active_m = mask_of(active)
+
+    # Criar matriz de valores (float32 basta para 5 categorias + NaN e
+    # corta pela metade a banda de memória do imshow)
     # 0 = vazio, 1 = contemplada (verde), 2 = disponível (amarelo), 3 = ativa não disponível (azul), 4 = lance 25% (vermelho)
-    matrix = np.zeros((rows, cols))
-    
-    for i in range(total_quotas):
-        quota = i + 1
-        row = i // cols
-        col = i % cols
-        
-        if quota in lance_25:
-            matrix[row, col] = 4  # Lance 25% - vermelho (prioridade máxima)
-        elif quota in contemplated:
-            matrix[row, col] = 1  # Verde
-        elif quota in available_active:
-            matrix[row, col] = 2  # Amarelo
-        elif quota in active:
-            matrix[row, col] = 3  # Azul
-        else:
-            matrix[row, col] = 0  # Não deveria acontecer
-    
-    # Preencher células vazias com NaN
-    for i in range(total_quotas, rows * cols):
-        row = i // cols
-        col = i % cols
-        matrix[row, col] = np.nan
+    # Atribuições em ordem inversa de prioridade: a última escrita vence,
+    # equivalente ao if/elif por cota, mas sem loop Python
+    values = np.zeros(total_quotas, dtype=np.float32)
+    values[active_m] = 3      # Azul
+    values[available_active_m] = 2  # Amarelo
+    values[contemplated_m] = 1      # Verde
+    values[lance_25_m] = 4    # Lance 25% - vermelho (prioridade máxima)
+
+    # Células além de total_quotas ficam NaN (vazias)
+    flat = np.full(rows * cols, np.nan, dtype=np.float32)
+    flat[:total_quotas] = values
+    matrix = flat.reshape(rows, cols)
     
-    # Criar figura
-    fig, ax = plt.subplots(figsize=(16, 12))
+    # Criar figura (grupos pequenos não precisam do canvas grande)
+    figsize = (12, 9) if total_quotas < 500 else (16, 12)
+    fig, ax = plt.subplots(figsize=figsize)
     
     # Criar colormap customizado
     from matplotlib.colors import ListedColormap
@@ -262,30 +268,20 @@ def visualizar_simples(grupo_path: str, output_path: str = None, show: bool = Fa
         else:
             fontsize = 3
         
-        for i in range(total_quotas):
-            quota = i + 1
-            row = i // cols
-            col = i % cols
-            
-            # Cor do texto baseada no fundo
-            if quota in lance_25:
-                color = 'white'
-                weight = 'bold'
-            elif quota in contemplated:
-                color = 'white'
-                weight = 'bold'
-            elif quota in available_active:
-                color = 'black'
-                weight = 'bold'
-            elif quota in active:
-                color = 'white'
-                weight = 'normal'
-            else:
-                color = 'black'
-                weight = 'normal'
-            
-            ax.text(col, row, str(quota), ha='center', va='center',
-                   fontsize=fontsize, color=color, weight=weight)
+        # Abaixo de 4pt o texto é ilegível: pular o loop inteiro economiza
+        # milhares de artists Text do matplotlib nos grupos grandes
+        if fontsize >= 4:
+            # Cor/peso do texto baseados no fundo, escolhidos em lote
+            conds = [lance_25_m, contemplated_m, available_active_m, active_m]
+            colors_per_quota = np.select(conds, ['white', 'white', 'black', 'white'],
+                                         default='black')
+            weights_per_quota = np.select(conds, ['bold', 'bold', 'bold', 'normal'],
+                                          default='normal')
+
+            for i in range(total_quotas):
+                ax.text(i % cols, i // cols, str(i + 1), ha='center', va='center',
+                       fontsize=fontsize, color=colors_per_quota[i],
+                       weight=weights_per_quota[i])
     
     # Configurar eixos
     ax.set_xticks([])
@@ -331,7 +327,9 @@ def visualizar_simples(grupo_path: str, output_path: str = None, show: bool = Fa
     if output_path is None:
         output_path = grupo_dir / "visualizacao_simples.png"
     
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
+    # tight_layout acima já ajusta as margens; bbox_inches='tight' renderizaria
+    # a figura uma segunda vez só para medir o bounding box
+    plt.savefig(output_path, dpi=dpi)
     print(f"✅ Visualização salva: {output_path}")
     
     # Mostrar apenas se solicitado